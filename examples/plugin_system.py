@@ -9,6 +9,8 @@ Demonstrates:
 
 from __future__ import annotations
 
+from typing import Any, ClassVar
+
 from lazyregistry import Registry
 
 # Global plugin registry
@@ -34,6 +36,8 @@ def plugin(name: str):
 class UppercasePlugin:
     """Convert text to uppercase."""
 
+    __slots__ = ()
+
     def process(self, text: str) -> str:
         return text.upper()
 
@@ -42,6 +46,8 @@ class UppercasePlugin:
 class LowercasePlugin:
     """Convert text to lowercase."""
 
+    __slots__ = ()
+
     def process(self, text: str) -> str:
         return text.lower()
 
@@ -50,6 +56,8 @@ class LowercasePlugin:
 class ReversePlugin:
     """Reverse text."""
 
+    __slots__ = ()
+
     def process(self, text: str) -> str:
         return text[::-1]
 
@@ -58,6 +66,8 @@ class ReversePlugin:
 class TitleCasePlugin:
     """Convert to title case."""
 
+    __slots__ = ()
+
     def process(self, text: str) -> str:
         return text.title()
 
@@ -68,18 +78,28 @@ class TitleCasePlugin:
 
 
 class PluginManager:
-    """Centralized plugin management."""
+    """Centralized plugin management.
 
-    @staticmethod
-    def execute(plugin_name: str, text: str) -> str:
+    Plugins are expected to be stateless: one instance per plugin class is
+    created on first use and shared by every later call.
+    """
+
+    _instances: ClassVar[dict[type, Any]] = {}
+
+    @classmethod
+    def execute(cls, plugin_name: str, text: str) -> str:
         """Execute a plugin by name."""
         plugin_class = PLUGINS[plugin_name]  # Lazy load here
-        return plugin_class().process(text)
+        # Keyed by class, so re-registering a name picks up the new plugin
+        instance = cls._instances.get(plugin_class)
+        if instance is None:
+            instance = cls._instances[plugin_class] = plugin_class()
+        return instance.process(text)
 
     @staticmethod
     def available() -> list[str]:
-        """List all available plugins."""
-        return sorted(PLUGINS.keys())
+        """List all available plugins, sorted by name."""
+        return sorted(PLUGINS)
 
     @staticmethod
     def pipeline(text: str, *plugin_names: str) -> str:
@@ -10,7 +10,8 @@ Demonstrates:
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from itertools import count, repeat
 from typing import Any
 
 from lazyregistry import NAMESPACE
@@ -40,6 +41,8 @@ class GPT2Config(PretrainedConfig):
 class BaseModel(PretrainedMixin):
     """Base model class for all transformer models."""
 
+    __slots__ = ("config",)
+
     config_class = PretrainedConfig
 
 
@@ -55,6 +58,8 @@ class AutoModel(AutoRegistry):
 class BertModel(BaseModel):
     """BERT model - saves/loads config only."""
 
+    __slots__ = ()
+
     config_class = BertConfig
 
 
@@ -62,6 +67,8 @@ class BertModel(BaseModel):
 class GPT2Model(BaseModel):
     """GPT-2 model - saves/loads config only."""
 
+    __slots__ = ()
+
     config_class = GPT2Config
 
 
@@ -89,6 +96,8 @@ class BPEConfig(PretrainedConfig):
 class BaseTokenizer(PretrainedMixin):
     """Base tokenizer with vocabulary state."""
 
+    __slots__ = ("config", "vocab")
+
     config_class = PretrainedConfig
 
     def __init__(self, *args, vocab: dict[str, int] | None = None, **kwargs):
@@ -100,23 +109,38 @@ class BaseTokenizer(PretrainedMixin):
         super().save_pretrained(save_directory)
 
         # Save vocabulary sorted by index
-        save_path = Path(save_directory)
-        vocab_file = save_path / "vocab.txt"
-        sorted_vocab = sorted(self.vocab.items(), key=lambda x: x[1])
-        vocab_file.write_text("\n".join(word for word, _ in sorted_vocab))
+        vocab_file = os.path.join(save_directory, "vocab.txt")
+        with open(vocab_file, "wb") as f:
+            f.write("\n".join(self._words_by_index()).encode())
+
+    def _words_by_index(self) -> list[str]:
+        """Return vocabulary words ordered by index."""
+        # Indices are normally dense (0..n-1), so each word can be placed directly in O(n)
+        n = len(self.vocab)
+        words: list[str | None] = [None] * n
+        for word, idx in self.vocab.items():
+            if not 0 <= idx < n:
+                break
+            words[idx] = word
+        else:
+            if None not in words:
+                return words  # type: ignore[return-value]
+        # Sparse or duplicate indices: fall back to sorting
+        return [word for word, _ in sorted(self.vocab.items(), key=lambda x: x[1])]
 
     @classmethod
-    def from_pretrained(cls, pretrained_path: PathLike, **kwargs: Any):
-        """Load config AND vocabulary."""
-        config_file = Path(pretrained_path) / cls.config_filename
-        config = cls.config_class.model_validate_json(config_file.read_text())
-
+    def load_from_config(cls, config: PretrainedConfig, pretrained_path: PathLike, **kwargs: Any):
+        """Load vocabulary alongside the already-loaded config."""
         # Load vocabulary
-        vocab_file = Path(pretrained_path) / "vocab.txt"
+        vocab_file = os.path.join(pretrained_path, "vocab.txt")
         vocab = {}
-        if vocab_file.exists():
-            words = vocab_file.read_text().strip().split("\n")
-            vocab = {word: idx for idx, word in enumerate(words)}
+        if os.path.exists(vocab_file):
+            with open(vocab_file, encoding="utf-8") as f:
+                # Split on "\n" only: str.splitlines() would also split on separators like "\x85" inside tokens
+                words = f.read().split("\n")
+            if not words[-1]:
+                words.pop()  # Trailing newline
+            vocab = dict(zip(words, count()))
 
         return cls(config=config, vocab=vocab, **kwargs)
 
@@ -125,7 +149,8 @@ class BaseTokenizer(PretrainedMixin):
         if self.config.lowercase:
             text = text.lower()
         words = text.split()[: self.config.max_length]
-        return [self.vocab.get(word, 0) for word in words]
+        # map() drives the dict lookups from C instead of a per-token Python loop
+        return list(map(self.vocab.get, words, repeat(0)))
 
 
 class AutoTokenizer(AutoRegistry):
@@ -140,6 +165,8 @@ class AutoTokenizer(AutoRegistry):
 class WordPieceTokenizer(BaseTokenizer):
     """WordPiece tokenizer."""
 
+    __slots__ = ()
+
     config_class = WordPieceConfig
 
 
@@ -147,6 +174,8 @@ class WordPieceTokenizer(BaseTokenizer):
 class BPETokenizer(BaseTokenizer):
     """BPE tokenizer."""
 
+    __slots__ = ()
+
     config_class = BPEConfig
 
 
@@ -1,20 +1,21 @@
-# Version is managed by hatch-vcs from Git tags
-try:
-    from ._version import __version__
-except ImportError:  # pragma: no cover
-    # Fallback for editable installs without build
-    try:
-        from importlib.metadata import version
+"""Lazy-loading registries with namespace support.
+
+Public names are resolved on first attribute access (PEP 562), so ``import lazyregistry`` stays cheap.
+Set ``LAZYREGISTRY_EAGER_IMPORT=1`` to resolve everything at import time instead (useful in CI).
+"""
 
-        __version__ = version("lazyregistry")
-    except Exception:
-        __version__ = "0.0.0.dev0"
+import os
+from importlib import import_module
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from .exceptions import FrozenRegistryError, ImportFailedError, LazyRegistryError
+    from .registry import NAMESPACE, ImportString, LazyImportDict, Namespace, Registry
 
-from .exceptions import ImportFailedError, LazyRegistryError
-from .registry import NAMESPACE, ImportString, LazyImportDict, Namespace, Registry
+    __version__: str
 
 __all__ = [
+    "FrozenRegistryError",
     "ImportFailedError",
     "ImportString",
     "LazyImportDict",
@@ -23,3 +24,56 @@ __all__ = [
     "Namespace",
     "Registry",
 ]
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    "FrozenRegistryError": ".exceptions",
+    "ImportFailedError": ".exceptions",
+    "LazyRegistryError": ".exceptions",
+    "NAMESPACE": ".registry",
+    "ImportString": ".registry",
+    "LazyImportDict": ".registry",
+    "Namespace": ".registry",
+    "Registry": ".registry",
+}
+
+# Submodules reachable as package attributes (e.g. ``lazyregistry.exceptions``)
+_SUBMODULES = ("exceptions", "pretrained", "registry")
+
+
+def _load_version() -> str:
+    # Version is managed by hatch-vcs from Git tags
+    try:
+        from ._version import __version__
+    except ImportError:  # pragma: no cover
+        # Fallback for editable installs without build
+        try:
+            from importlib.metadata import version
+
+            __version__ = version("lazyregistry")
+        except Exception:
+            __version__ = "0.0.0.dev0"
+    return __version__
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        value = _load_version()
+    elif name in _LAZY_ATTRS:
+        value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+    elif name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES) | {"__version__"})
+
+
+if os.environ.get("LAZYREGISTRY_EAGER_IMPORT") == "1":  # pragma: no cover
+    for _name in (*__all__, "__version__"):
+        __getattr__(_name)
@@ -1,6 +1,6 @@
 """Custom exceptions for lazyregistry."""
 
-__all__ = ["LazyRegistryError", "ImportFailedError"]
+__all__ = ["LazyRegistryError", "ImportFailedError", "FrozenRegistryError"]
 
 
 class LazyRegistryError(Exception):
@@ -17,6 +17,15 @@ class ImportFailedError(ImportError, LazyRegistryError):
     * ``LazyRegistryError`` — catch-all for any lazyregistry error.
     * ``ImportFailedError`` — the most specific type.
 
-    The original ``pydantic.ValidationError`` is chained as ``__cause__``
-    for full diagnostic details.
+    The original ``ImportError`` raised while resolving the import string is
+    chained as ``__cause__`` for full diagnostic details.
+    """
+
+
+class FrozenRegistryError(TypeError, LazyRegistryError):
+    """Raised when modifying a registry that has been frozen.
+
+    Inherits from ``TypeError`` to match the built-in read-only mappings
+    (e.g. ``types.MappingProxyType``), and from ``LazyRegistryError`` as the
+    lazyregistry catch-all.
     """
@@ -5,12 +5,12 @@ Provides base classes and utilities for implementing HuggingFace-style
 save_pretrained/from_pretrained patterns with automatic model registration.
 """
 
-import json
 import os
-from pathlib import Path
-from typing import Any, ClassVar, Type, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Type, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from lazyregistry.registry import Registry
 
@@ -18,6 +18,32 @@ __all__ = ["PathLike", "PretrainedConfig", "PretrainedMixin", "AutoRegistry"]
 
 PathLike = Union[str, os.PathLike]
 
+# Parses raw config JSON with pydantic-core's Rust parser, which is much faster than the stdlib ``json`` module.
+_raw_config_adapter = TypeAdapter(Dict[str, Any])
+
+
+@lru_cache(maxsize=64)
+def _read_file_cached(path: str, dev: int, ino: int, size: int, mtime_ns: int) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _read_config_bytes(config_file: str) -> bytes:
+    """Read a config file, reusing the previous contents while the file is unchanged.
+
+    The cache is keyed by path plus file identity, size and modification time, so
+    rewriting or replacing the file invalidates the entry. On filesystems with coarse
+    timestamps an in-place rewrite of the same size can keep the same key, so
+    ``save_pretrained`` also clears the cache after writing.
+    """
+    st = os.stat(config_file)
+    return _read_file_cached(config_file, st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _config_path(directory: PathLike, config_filename: str) -> str:
+    """Return the path of ``config_filename`` inside ``directory``."""
+    return os.path.join(directory, config_filename)
+
 
 class PretrainedConfig(BaseModel):
     """
@@ -54,6 +80,10 @@ class PretrainedMixin:
     PretrainedConfig). If using AutoRegistry, include a type identifier field in
     your config (commonly "model_type", but configurable).
 
+    To load state beyond the config (e.g. a vocabulary), override ``load_from_config``
+    rather than ``from_pretrained``: it receives the already-loaded config, so
+    AutoRegistry can hand over the config it parsed instead of reading it again.
+
     Example:
         >>> # Model-specific config with type identifier
         >>> class BertConfig(PretrainedConfig):
@@ -75,6 +105,10 @@ class PretrainedMixin:
         >>> loaded = BertModel.from_pretrained("./bert_model")
     """
 
+    # Empty so the mixin can be combined with any base, including slotted ones. Concrete
+    # base classes can declare ``__slots__ = ("config",)`` to drop the per-instance __dict__.
+    __slots__ = ()
+
     config_class: ClassVar[Type[PretrainedConfig]]
     config_filename: ClassVar[str] = "config.json"
 
@@ -83,23 +117,44 @@ class PretrainedMixin:
 
     def save_pretrained(self, save_directory: PathLike) -> None:
         """Save the model configuration to a directory."""
-        save_path = Path(save_directory)
-        save_path.mkdir(parents=True, exist_ok=True)
-
-        config_file = save_path / self.config_filename
-        config_file.write_text(self.config.model_dump_json(indent=2))
+        # A single stat() in the common case; os.makedirs() needs three syscalls on an existing directory
+        if not os.path.isdir(save_directory):
+            os.makedirs(save_directory, exist_ok=True)
+
+        config_file = _config_path(save_directory, self.config_filename)
+        # Same output as ``model_dump_json(indent=2)``, but serialized straight to bytes
+        serializer = type(self.config).__pydantic_serializer__
+        with open(config_file, "wb") as f:
+            f.write(serializer.to_json(self.config, indent=2))
+        # The rewritten file may still match a cached (size, mtime) key within one timestamp tick
+        _read_file_cached.cache_clear()
 
     @classmethod
     def from_pretrained(cls, pretrained_path: PathLike, **kwargs: Any):
         """Load a model from a saved configuration."""
-        config_file = Path(pretrained_path) / cls.config_filename
-        config = cls.config_class.model_validate_json(config_file.read_text())
+        config_file = _config_path(pretrained_path, cls.config_filename)
+        config = cls.config_class.model_validate_json(_read_config_bytes(config_file))
+        return cls.load_from_config(config, pretrained_path, **kwargs)
+
+    @classmethod
+    def load_from_config(cls, config: PretrainedConfig, pretrained_path: PathLike, **kwargs: Any):
+        """Build a model from its loaded config. Override to load additional state from ``pretrained_path``."""
         return cls(config=config, **kwargs)
 
     def __repr__(self):
         return f"{self.__class__.__name__}(config={self.config!r})"
 
 
+def _uses_default_loader(model_class: Any) -> bool:
+    """Whether ``model_class`` loads through the default ``PretrainedMixin.from_pretrained``."""
+    return (
+        isinstance(model_class, type)
+        and issubclass(model_class, PretrainedMixin)
+        # Overrides may be staticmethods or plain functions, which have no __func__
+        and getattr(model_class.from_pretrained, "__func__", None) is PretrainedMixin.from_pretrained.__func__  # type: ignore[attr-defined]
+    )
+
+
 class AutoRegistry:
     """
     Auto-loader registry for pretrained models.
@@ -211,10 +266,13 @@ class AutoRegistry:
 
         This method reads the config JSON to extract the type identifier,
         then delegates to the appropriate model class's from_pretrained method.
+        For PretrainedMixin subclasses that keep the default from_pretrained, the
+        config file is read only once and passed on through ``load_from_config``.
         """
         # TODO: support hf hub or remote. e.g. https://github.com/huggingface/transformers/blob/517197f795e3b44229bdf226d4cddf5240cc644a/src/transformers/configuration_utils.py#L670-L700
-        config_file = Path(pretrained_path) / cls.config_filename
-        raw = json.loads(config_file.read_text())
+        config_file = _config_path(pretrained_path, cls.config_filename)
+        data = _read_config_bytes(config_file)
+        raw = _raw_config_adapter.validate_json(data)
         model_type = raw.get(cls.type_key)
         if model_type is None:
             raise ValueError(
@@ -222,4 +280,26 @@ class AutoRegistry:
                 f"Make sure your config includes this field."
             )
         model_class = cls.registry[model_type]
+        if _uses_default_loader(model_class) and model_class.config_filename == cls.config_filename:
+            # Validate in JSON mode, exactly as PretrainedMixin.from_pretrained would
+            config = model_class.config_class.model_validate_json(data)
+            return model_class.load_from_config(config, pretrained_path, **kwargs)
         return model_class.from_pretrained(pretrained_path, **kwargs)
+
+    @classmethod
+    def from_pretrained_many(
+        cls, pretrained_paths: Iterable[PathLike], max_workers: Optional[int] = None, **kwargs: Any
+    ) -> List[Any]:
+        """Load several models concurrently, auto-detecting each one's type.
+
+        Loading is dominated by file I/O, so a thread pool overlaps it across paths.
+        Results are returned in the order of ``pretrained_paths``; the first
+        failure is re-raised.
+
+        Args:
+            pretrained_paths: Directories to load from.
+            max_workers: Thread pool size (defaults to ``ThreadPoolExecutor``'s default).
+            **kwargs: Passed to every ``from_pretrained`` call.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(partial(cls.from_pretrained, **kwargs), pretrained_paths))
@@ -16,21 +16,53 @@ from __future__ import annotations
 
 import sys
 from collections import UserDict
-from typing import TYPE_CHECKING, Generic, TypeVar
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-from pydantic import ImportString as PydanticImportString
-from pydantic import TypeAdapter, ValidationError
-
-from .exceptions import ImportFailedError
+from .exceptions import FrozenRegistryError, ImportFailedError
 
 __all__ = ["ImportString", "LazyImportDict", "Registry", "Namespace", "NAMESPACE"]
 
-_import_adapter = TypeAdapter(PydanticImportString)
-
 K = TypeVar("K")
 V = TypeVar("V")
 
 
+def _import_object(path: str) -> Any:
+    """Resolve a ``"module[:attr]"`` or dotted ``"module.attr"`` path.
+
+    Follows the same rules as ``pydantic.ImportString``, without going through the validator stack.
+    """
+    module_path, sep, attribute = path.strip().partition(":")
+    if ":" in attribute:
+        raise ImportError(f"Import strings should have at most one ':'; received {path!r}")
+    if not module_path:
+        raise ImportError(f"Import strings should have a nonempty module name; received {path!r}")
+
+    try:
+        module = import_module(module_path)
+    except ModuleNotFoundError:
+        if not sep and "." in module_path:
+            # Try interpreting the final dotted segment as an attribute, not a submodule
+            maybe_module_path, _, maybe_attribute = module_path.rpartition(".")
+            try:
+                return _import_object(f"{maybe_module_path}:{maybe_attribute}")
+            except ImportError:
+                pass
+        raise
+
+    if not sep:
+        return module
+    try:
+        return getattr(module, attribute)
+    except AttributeError as e:
+        raise ImportError(f"cannot import name {attribute!r} from {module_path!r}") from e
+
+
+def _intern(key: Any) -> Any:
+    """Intern plain ``str`` keys so lookups with identical key objects hit dict's identity fast path."""
+    return sys.intern(key) if type(key) is str else key
+
+
 class ImportString(str):
     """String that represents an import path.
 
@@ -44,14 +76,17 @@ class ImportString(str):
     def load(self):
         """Import and return the object referenced by this import string.
 
+        Modules are cached in ``sys.modules`` by the import system, but the attribute is looked up
+        again on every call so that patched or reloaded attributes are picked up.
+
         Raises:
             ImportFailedError: If the import string cannot be resolved.
-                The original ``pydantic.ValidationError`` is chained as
-                ``__cause__`` for full diagnostic details.
+                The original ``ImportError`` is chained as ``__cause__``
+                for full diagnostic details.
         """
         try:
-            return _import_adapter.validate_python(self)
-        except ValidationError as e:
+            return _import_object(self)
+        except ImportError as e:
             raise ImportFailedError(f"Failed to import '{self}'") from e
 
 
@@ -66,26 +101,85 @@ class LazyImportDict(UserDict, Generic[K, V]):
         >>> registry = LazyImportDict()
         >>> registry["json"] = "json:dumps"  # Auto-converted to ImportString
         >>> registry.update({"pickle": "pickle:dumps"})
+        >>> registry.freeze()  # Read-only from now on; lookups still load lazily
     """
 
     data: dict[K, V]  # on python>=3.9, it's enough to remove this line and use `UserDict[K, V]` as base class
     auto_import_strings: bool = True
     eager_load: bool = False
+    _frozen: bool = False
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the registry has been frozen with :meth:`freeze`."""
+        return self._frozen
+
+    def freeze(self) -> None:
+        """Make the registry read-only.
+
+        Any further assignment, update or deletion raises ``FrozenRegistryError``.
+        Import strings are still resolved lazily on first access.
+        """
+        self._frozen = True
+
+    def __copy__(self):
+        # UserDict.copy() would copy the frozen flag and then fail in update(); it also loads every entry.
+        # Copy the raw data instead, so pending import strings stay lazy and the copy is always mutable.
+        c = self.__class__.__new__(self.__class__)
+        c.__dict__.update(self.__dict__)
+        c.data = dict(self.data)
+        c._frozen = False
+        return c
+
+    copy = __copy__
+
+    def _check_not_frozen(self) -> None:
+        if self._frozen:
+            raise FrozenRegistryError(f"{type(self).__name__} is frozen and cannot be modified")
 
     def __setitem__(self, key: K, item: V) -> None:
+        self._check_not_frozen()
+        key = _intern(key)
+        value: object = item
         if self.auto_import_strings and isinstance(item, str):
-            self.data[key] = ImportString(item)  # type: ignore[assignment, ty:invalid-assignment]
-        else:
-            self.data[key] = item
-
-        if self.eager_load:
-            _ = self[key]
+            value = ImportString(item)
+
+        if self.eager_load and isinstance(value, ImportString):
+            # Store the resolved object directly; a failed import leaves the registry unchanged
+            value = value.load()
+
+        self.data[key] = value  # type: ignore[assignment, ty:invalid-assignment]
+
+    def __delitem__(self, key: K) -> None:
+        self._check_not_frozen()
+        del self.data[key]
+
+    def __ior__(self, other: Any):
+        # UserDict.__ior__ writes to self.data directly, bypassing conversion and the frozen check
+        self.update(other)
+        return self
+
+    def update(self, other: Any = (), /, **kwargs: V) -> None:  # type: ignore[override]
+        self._check_not_frozen()
+        # Fast path: convert all values up front and insert them in a single dict.update()
+        # instead of going through __setitem__ once per item.
+        if self.eager_load or type(self).__setitem__ is not LazyImportDict.__setitem__:
+            super().update(other, **kwargs)
+            return
+
+        items = {_intern(key): item for key, item in dict(other, **kwargs).items()}
+        if self.auto_import_strings:
+            for key, item in items.items():
+                if isinstance(item, str):
+                    items[key] = ImportString(item)
+        self.data.update(items)
 
     def __getitem__(self, key: K) -> V:
         value = self.data[key]
         if isinstance(value, ImportString):
-            self.data[key] = value.load()
-        return self.data[key]
+            # Replace the import string with the resolved object so later lookups are a plain dict hit.
+            value = self.data[key] = value.load()
+        return value
 
 
 class Registry(LazyImportDict[K, V], Generic[K, V]):
@@ -124,9 +218,19 @@ class Namespace(_NamespaceBase):
         >>> plugin = namespace["plugins"]["my_plugin"]
     """
 
+    def __getitem__(self, key: str) -> Registry:
+        # A single dict probe on the common path; UserDict.__getitem__ does a membership test first.
+        registry = self.data.get(key)
+        if registry is None:
+            registry = self.__missing__(key)
+        return registry
+
+    def __setitem__(self, key: str, item: Registry) -> None:
+        self.data[_intern(key)] = item
+
     def __missing__(self, key: str) -> Registry:
-        self.data[key] = Registry(name=key)
-        return self.data[key]
+        key = _intern(key)
+        return self.data.setdefault(key, Registry(name=key))
 
 
 # Global namespace instance
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import tempfile
 from pathlib import Path
 from typing import Any
@@ -62,6 +63,35 @@ class TestPretrainedMixin:
         assert model.config == config
         assert model.config.value == 100
 
+    def test_slots(self):
+        """Subclasses declaring __slots__ should not get a per-instance __dict__."""
+
+        class SlottedModel(PretrainedMixin):
+            __slots__ = ("config",)
+            config_class = SimpleConfig
+
+        model = SlottedModel(config=SimpleConfig())
+        assert not hasattr(model, "__dict__")
+
+        # Subclasses without __slots__ keep accepting arbitrary attributes
+        model = SimpleModel(config=SimpleConfig())
+        model.extra = 1
+        assert model.extra == 1
+
+    def test_combine_with_slotted_base(self):
+        """PretrainedMixin should combine with a base that has a non-empty slot layout."""
+
+        class SlottedBase:
+            __slots__ = ("weights",)
+
+        class CombinedModel(PretrainedMixin, SlottedBase):
+            config_class = SimpleConfig
+
+        model = CombinedModel(config=SimpleConfig(value=7))
+        model.weights = [1.0]
+        assert model.config.value == 7
+        assert model.weights == [1.0]
+
     def test_save_pretrained(self):
         """Test saving pretrained model."""
         config = SimpleConfig(value=123)
@@ -79,6 +109,19 @@ class TestPretrainedMixin:
             assert saved_config.model_type == "test"
             assert saved_config.value == 123
 
+    def test_save_pretrained_creates_directory(self):
+        """Test saving into a directory that does not exist yet."""
+        model = SimpleModel(config=SimpleConfig(value=1))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            save_dir = Path(tmpdir) / "nested" / "model"
+            model.save_pretrained(save_dir)
+            assert (save_dir / "config.json").exists()
+
+            # Saving again into the existing directory overwrites the config
+            model.save_pretrained(save_dir)
+            assert SimpleModel.from_pretrained(save_dir).config.value == 1
+
     def test_from_pretrained(self):
         """Test loading pretrained model."""
         config = SimpleConfig(value=456)
@@ -102,6 +145,22 @@ class TestPretrainedMixin:
 
             assert model.config == loaded.config
 
+    def test_from_pretrained_sees_updated_config(self):
+        """Test loading again after the config file changes returns the new config."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = os.path.join(tmpdir, "config.json")
+            SimpleModel(config=SimpleConfig(value=1)).save_pretrained(tmpdir)
+            assert SimpleModel.from_pretrained(tmpdir).config.value == 1
+            old_stat = os.stat(config_file)
+
+            SimpleModel(config=SimpleConfig(value=2)).save_pretrained(tmpdir)
+            assert SimpleModel.from_pretrained(tmpdir).config.value == 2
+
+            # Same size and same mtime, as on a filesystem with coarse timestamps
+            SimpleModel(config=SimpleConfig(value=3)).save_pretrained(tmpdir)
+            os.utime(config_file, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+            assert SimpleModel.from_pretrained(tmpdir).config.value == 3
+
 
 class CustomConfig(PretrainedConfig):
     """Config with custom state."""
@@ -277,6 +336,30 @@ class TestAutoRegistry:
                 assert loaded_bert.config.value == 111
                 assert loaded_gpt.config.value == 222
 
+    def test_from_pretrained_many(self):
+        """Test loading several models at once preserves order and types."""
+        models = [
+            BertTestModel(config=BertConfig(value=1)),
+            GPTTestModel(config=GPTConfig(value=2)),
+            BertTestModel(config=BertConfig(value=3)),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [Path(tmpdir) / str(i) for i in range(len(models))]
+            for model, path in zip(models, paths):
+                model.save_pretrained(path)
+
+            loaded = AutoTestModel.from_pretrained_many(paths, max_workers=2)
+
+            assert [type(m) for m in loaded] == [BertTestModel, GPTTestModel, BertTestModel]
+            assert [m.config.value for m in loaded] == [1, 2, 3]
+
+    def test_from_pretrained_many_propagates_errors(self):
+        """Test from_pretrained_many re-raises a failing load."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(FileNotFoundError):
+                AutoTestModel.from_pretrained_many([Path(tmpdir) / "missing"])
+
     def test_unknown_model_type(self):
         """Test error for unknown model type."""
 
@@ -314,6 +397,70 @@ class TestAutoRegistry:
             with pytest.raises(ValueError, match="does not contain required type key"):
                 AutoTestModel.from_pretrained(tmpdir)
 
+    def test_from_pretrained_passes_config_to_hook(self):
+        """AutoRegistry should hand the parsed config to load_from_config for default loaders."""
+        calls = []
+
+        class HookedModel(BaseTestModel):
+            config_class = SimpleConfig
+
+            @classmethod
+            def load_from_config(cls, config, pretrained_path, **kwargs):
+                calls.append(pretrained_path)
+                return super().load_from_config(config, pretrained_path, **kwargs)
+
+        AutoTestModel.registry["test"] = HookedModel
+        with tempfile.TemporaryDirectory() as tmpdir:
+            HookedModel(config=SimpleConfig(value=5)).save_pretrained(tmpdir)
+            loaded = AutoTestModel.from_pretrained(tmpdir)
+
+            assert isinstance(loaded, HookedModel)
+            assert loaded.config.value == 5
+            assert calls == [tmpdir]
+
+    def test_from_pretrained_with_user_from_config(self):
+        """A subclass defining its own HF-style from_config should still load normally."""
+
+        class FromConfigModel(BaseTestModel):
+            config_class = SimpleConfig
+
+            @classmethod
+            def from_config(cls, config, **kwargs):
+                return cls(config=config, **kwargs)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            FromConfigModel(config=SimpleConfig(value=4)).save_pretrained(tmpdir)
+            loaded = FromConfigModel.from_pretrained(tmpdir)
+
+            assert isinstance(loaded, FromConfigModel)
+            assert loaded.config.value == 4
+
+    def test_from_pretrained_custom_loader(self):
+        """AutoRegistry should delegate to an overridden from_pretrained."""
+        AutoTestModel.registry["custom"] = CustomModel
+        vocab = {"<unk>": 0, "hello": 1}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            CustomModel(config=CustomConfig(), vocab=vocab).save_pretrained(tmpdir)
+            loaded = AutoTestModel.from_pretrained(tmpdir)
+
+            assert isinstance(loaded, CustomModel)
+            assert loaded.vocab == vocab
+
+    def test_from_pretrained_staticmethod_loader(self):
+        """AutoRegistry should delegate to a from_pretrained overridden as a staticmethod."""
+
+        class StaticLoaderModel(BaseTestModel):
+            config_class = SimpleConfig
+
+            @staticmethod
+            def from_pretrained(pretrained_path, **kwargs):
+                return "static"
+
+        AutoTestModel.registry["test"] = StaticLoaderModel
+        with tempfile.TemporaryDirectory() as tmpdir:
+            StaticLoaderModel(config=SimpleConfig()).save_pretrained(tmpdir)
+            assert AutoTestModel.from_pretrained(tmpdir) == "static"
+
     def test_cannot_instantiate(self):
         """Test that AutoRegistry cannot be instantiated."""
         with pytest.raises(TypeError, match="should not be instantiated"):
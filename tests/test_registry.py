@@ -1,9 +1,16 @@
 """Tests for core registry functionality."""
 
+import copy
+import os
+import subprocess
+import sys
+from unittest import mock
+
 import pytest
 
+import lazyregistry
 from lazyregistry import NAMESPACE
-from lazyregistry.exceptions import ImportFailedError, LazyRegistryError
+from lazyregistry.exceptions import FrozenRegistryError, ImportFailedError, LazyRegistryError
 from lazyregistry.registry import ImportString, LazyImportDict, Namespace, Registry
 
 
@@ -21,6 +28,20 @@ class TestImportString:
 
         assert func is json.dumps
 
+    def test_load_method_sees_patched_attribute(self):
+        """A new registry entry should resolve to the current attribute, not an earlier load."""
+        import json
+
+        assert ImportString("json:dumps").load() is json.dumps
+
+        sentinel = object()
+        with mock.patch("json.dumps", sentinel):
+            registry = Registry(name="patched")
+            registry["json"] = "json:dumps"
+            assert registry["json"] is sentinel
+
+        assert ImportString("json:dumps").load() is json.dumps
+
     def test_load_method_invalid_import(self):
         """Test load() raises ImportFailedError for invalid import string."""
         import_str = ImportString("nonexistent_module:function")
@@ -43,14 +64,13 @@ class TestImportString:
             import_str.load()
 
     def test_load_method_invalid_import_chains_cause(self):
-        """ImportFailedError should chain the original pydantic ValidationError."""
+        """ImportFailedError should chain the original ImportError."""
         import_str = ImportString("nonexistent_module:function")
 
         with pytest.raises(ImportFailedError) as exc_info:
             import_str.load()
 
-        assert exc_info.value.__cause__ is not None
-        assert "ValidationError" in type(exc_info.value.__cause__).__name__
+        assert isinstance(exc_info.value.__cause__, ModuleNotFoundError)
 
     def test_load_method_invalid_attribute(self):
         """Test load() raises ImportFailedError for invalid attribute."""
@@ -59,6 +79,28 @@ class TestImportString:
         with pytest.raises(ImportFailedError, match="Failed to import 'json:nonexistent_func'"):
             import_str.load()
 
+    def test_load_method_module(self):
+        """Test load() returns the module when no attribute is given."""
+        import collections.abc
+
+        assert ImportString("collections.abc").load() is collections.abc
+
+    def test_load_method_dotted_attribute(self):
+        """Test load() falls back to an attribute for dotted paths without a colon."""
+        import collections.abc
+
+        assert ImportString("collections.abc.Mapping").load() is collections.abc.Mapping
+
+    def test_load_method_rejects_dotted_attribute_chain(self):
+        """Test load() resolves a single attribute after the colon, like pydantic.ImportString."""
+        with pytest.raises(ImportFailedError, match="Failed to import 'json:dumps.__name__'"):
+            ImportString("json:dumps.__name__").load()
+
+    def test_load_method_multiple_colons(self):
+        """Test load() raises ImportFailedError for more than one colon."""
+        with pytest.raises(ImportFailedError, match="Failed to import 'collections:abc:Mapping'"):
+            ImportString("collections:abc:Mapping").load()
+
     def test_load_method_empty_string(self):
         """Test load() raises ImportFailedError for empty string."""
         import_str = ImportString("")
@@ -83,6 +125,15 @@ class TestLazyImportDict:
         assert callable(func)
         assert not isinstance(registry.data["json"], ImportString)
 
+    def test_getitem_caches_loaded_value(self):
+        """Test __getitem__ replaces the ImportString with the loaded object."""
+        registry = LazyImportDict()
+        registry["json"] = "json:dumps"
+
+        func = registry["json"]
+        assert registry.data["json"] is func
+        assert registry["json"] is func
+
     def test_setitem_with_instance(self):
         """Test __setitem__ with actual instance."""
         registry = LazyImportDict()
@@ -113,6 +164,28 @@ class TestLazyImportDict:
 
         assert registry["json"] is json.dumps
 
+    def test_update_accepts_pairs_and_kwargs(self):
+        """Test update() accepts iterables of pairs and keyword arguments like dict.update()."""
+        registry = LazyImportDict()
+        registry.update([("json", "json:dumps")], pickle="pickle:dumps")
+
+        assert isinstance(registry.data["json"], ImportString)
+        assert isinstance(registry.data["pickle"], ImportString)
+
+        import pickle
+
+        assert registry["pickle"] is pickle.dumps
+
+    def test_update_with_eager_load(self):
+        """Test update() loads values immediately when eager_load is set."""
+        registry = LazyImportDict()
+        registry.eager_load = True
+        registry.update({"json": "json:dumps"})
+
+        import json
+
+        assert registry.data["json"] is json.dumps
+
     def test_auto_import_strings_behavior(self):
         """Test auto_import_strings attribute behavior."""
         registry = LazyImportDict()
@@ -151,6 +224,11 @@ class TestLazyImportDict:
         assert not isinstance(registry.data["json"], ImportString)
         assert callable(registry.data["json"])
 
+        # A failed eager import is raised and nothing is stored
+        with pytest.raises(ImportFailedError):
+            registry["missing"] = "nonexistent_module:function"
+        assert "missing" not in registry.data
+
         # eager_load has no effect when auto_import_strings is False
         registry.auto_import_strings = False
         registry["plain"] = "plain string"
@@ -189,6 +267,71 @@ class TestLazyImportDict:
         assert registry["auto_import_strings"] == "value1"  # Dict item exists
         assert registry["eager_load"] == "value2"  # Dict item exists
 
+    def test_freeze(self):
+        """Test freeze() makes the dict read-only while keeping lazy loading."""
+        registry = LazyImportDict()
+        registry["json"] = "json:dumps"
+        assert not registry.frozen
+
+        registry.freeze()
+        assert registry.frozen
+
+        with pytest.raises(FrozenRegistryError):
+            registry["pickle"] = "pickle:dumps"
+        with pytest.raises(FrozenRegistryError):
+            registry.update({"pickle": "pickle:dumps"})
+        with pytest.raises(FrozenRegistryError):
+            registry |= {"pickle": "pickle:dumps"}
+        with pytest.raises(FrozenRegistryError):
+            del registry["json"]
+        with pytest.raises(FrozenRegistryError):
+            registry.pop("json")
+        assert list(registry.data) == ["json"]
+
+        # Lookups still resolve import strings
+        import json
+
+        assert registry["json"] is json.dumps
+
+    def test_copy_of_frozen_is_mutable(self):
+        """copy() of a frozen registry should return a mutable, independent registry."""
+        registry = Registry(name="frozen")
+        registry["json"] = "json:dumps"
+        registry.freeze()
+
+        for clone in (registry.copy(), copy.copy(registry)):
+            assert isinstance(clone, Registry)
+            assert clone.name == "frozen"
+            assert not clone.frozen
+            assert isinstance(clone.data["json"], ImportString)  # Copying does not trigger imports
+
+            clone["pickle"] = "pickle:dumps"
+            assert "pickle" in clone
+            assert "pickle" not in registry
+
+        assert registry.frozen
+
+    def test_frozen_error_types(self):
+        """FrozenRegistryError should be catchable as TypeError and LazyRegistryError."""
+        registry = LazyImportDict()
+        registry.freeze()
+
+        with pytest.raises(TypeError):
+            registry["key"] = "value"
+        with pytest.raises(LazyRegistryError):
+            registry["key"] = "value"
+
+    def test_keys_are_interned(self):
+        """String keys should be interned on registration."""
+        registry = LazyImportDict()
+        key = "".join(["dyn", "amic_key"])
+        registry[key] = "json:dumps"
+        registry.update({"".join(["bulk", "_key"]): "json:loads"})
+
+        stored = {k: k for k in registry.data}
+        assert stored["dynamic_key"] is sys.intern("dynamic_key")
+        assert stored["bulk_key"] is sys.intern("bulk_key")
+
     def test_key_error(self):
         """Test KeyError for missing keys."""
         registry = LazyImportDict()
@@ -229,6 +372,9 @@ class TestNamespace:
         assert registry.name == "models"
         assert "models" in ns.data
 
+        # Later access should return the same registry
+        assert ns["models"] is registry
+
     def test_namespace_isolation(self):
         """Registries in namespace should be isolated."""
         ns = Namespace()
@@ -255,6 +401,51 @@ class TestGlobalNamespace:
         assert callable(func)
 
 
+class TestPackageImport:
+    """Test lazy attribute access on the top-level package."""
+
+    def test_import_is_lazy(self):
+        """Importing the package should not import its submodules."""
+        code = "import sys, lazyregistry; print('lazyregistry.registry' in sys.modules)"
+        env = {k: v for k, v in os.environ.items() if k != "LAZYREGISTRY_EAGER_IMPORT"}
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=10)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "False"
+
+    def test_submodule_access(self):
+        """Submodules should be reachable as package attributes right after a bare import."""
+        code = (
+            "import lazyregistry; "
+            "print(lazyregistry.exceptions.ImportFailedError.__name__, lazyregistry.registry.Registry.__name__, "
+            "lazyregistry.pretrained.AutoRegistry.__name__)"
+        )
+        env = {k: v for k, v in os.environ.items() if k != "LAZYREGISTRY_EAGER_IMPORT"}
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=10)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ["ImportFailedError", "Registry", "AutoRegistry"]
+
+    def test_eager_import_env(self):
+        """LAZYREGISTRY_EAGER_IMPORT=1 should resolve all names at import time."""
+        code = "import sys, lazyregistry; print('lazyregistry.registry' in sys.modules)"
+        env = {**os.environ, "LAZYREGISTRY_EAGER_IMPORT": "1"}
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=10)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "True"
+
+    def test_public_names(self):
+        """All names in __all__ should resolve to the submodule objects."""
+        for name in lazyregistry.__all__:
+            assert getattr(lazyregistry, name) is not None
+        assert lazyregistry.Registry is Registry
+        assert isinstance(lazyregistry.__version__, str)
+        assert set(lazyregistry.__all__) <= set(dir(lazyregistry))
+
+    def test_unknown_attribute(self):
+        """Unknown attributes should raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = lazyregistry.does_not_exist
+
+
 class TestIntegration:
     """Integration tests."""
 